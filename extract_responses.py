@@ -1,7 +1,11 @@
 import argparse
+import contextvars
+import hashlib
 import logging
 import os
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from dotenv import load_dotenv
 from pathlib import Path
 from ulid import ULID
@@ -26,18 +30,38 @@ from voz_vcdr.utils import (
     reorder_module_questions
 )
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="{asctime} - {levelname} - {message}",
-    style="{",
-    datefmt="%Y-%m-%d %H:%M",
-)
-
 logger = logging.getLogger(__name__)
 
+# Title of the module being scored in this thread; modules run concurrently,
+# so every log line is prefixed with it to keep interleaved output readable
+current_module_title = contextvars.ContextVar("current_module_title", default=None)
+
+
+class ModuleTitleFilter(logging.Filter):
+    def filter(self, record):
+        title = current_module_title.get()
+        if title is not None:
+            record.msg = f"[{title}] {record.msg}"
+        return True
+
+
+logger.addFilter(ModuleTitleFilter())
+
 # Load environment variables from .env
 load_dotenv(override=True)
 
+# One parquet file per key: writers on different machines sharing the
+# directory never rewrite each other's entries
+ENCODE_CACHE_DIR = (
+    Path(os.getenv("VCDR_CACHE_DIR") or Path.home() / ".cache" / "vcdr")
+    / "encode_response"
+)
+
+OUTPUT_FORMATS = ("json", "csv", "html")
+
+# Modules of one conversation are independent, mostly network-bound work
+MODULE_WORKERS = 4
+
 
 def upload_responses(conversation_id: ULID, module_id: ULID, data: SurveyResponse):
     """
@@ -64,7 +88,151 @@ def upload_responses(conversation_id: ULID, module_id: ULID, data: SurveyRespons
     response.raise_for_status()
 
 
-def extract_responses(conversation_id: ULID, module_id: ULID, upload: bool = True):
+@lru_cache(maxsize=32)
+def parse_ulid(value: str) -> ULID:
+    return ULID.from_str(str(value))
+
+
+@lru_cache(maxsize=64)
+def load_module_survey(module_id: ULID):
+    """
+    Fetch, reorder and parse the survey for a module, once per process
+    """
+    module = fetch_survey_module(module_id)
+    module_reorder = reorder_module_questions(module)
+    return module_reorder, load_survey_config(module_reorder)
+
+
+def scoring_cache_enabled() -> bool:
+    return os.getenv("VCDR_SCORING_CACHE") == "1"
+
+
+def encode_cache_key(survey_json: str, transcript_sha: str) -> str:
+    # encode_response only sees the survey and transcript, so the shared
+    # cache can reuse a result across conversations and modules
+    return hashlib.sha256(f"{survey_json}\0{transcript_sha}".encode()).hexdigest()
+
+
+def scoring_cache_key(module_id: ULID, survey_json: str, transcript_sha: str) -> str:
+    return hashlib.sha256(
+        f"{module_id}\0{survey_json}\0{transcript_sha}".encode()
+    ).hexdigest()
+
+
+def load_cached_score(cache_file: Path) -> SurveyResponse | None:
+    if not cache_file.exists():
+        return None
+    # A cache entry is never worth failing a run over; treat bad ones as a miss
+    # (pydantic's ValidationError is a ValueError)
+    try:
+        scored_result = SurveyResponse.model_validate_json(
+            cache_file.read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cached scoring result {cache_file}: {e}")
+        return None
+    logger.info(f"Using cached scoring result {cache_file}")
+    return scored_result
+
+
+def store_cached_score(cache_file: Path, scored_json: str):
+    # Write to a temporary file first so readers never see a partial result
+    tmp_file = cache_file.with_suffix(".tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(scored_json, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Could not cache scoring result to {cache_file}: {e}")
+        tmp_file.unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=1)
+def import_pyarrow():
+    """
+    Import pyarrow on first use of the shared cache; None when not installed
+    """
+    # Importing pyarrow takes ~100ms and the cache is off by default, so
+    # plain runs should not pay for it
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:  # pyarrow is optional; only the shared scoring cache needs it
+        return None
+    return pa, pq
+
+
+def read_encode_cache(cache_key: str) -> SurveyResponse | None:
+    """
+    Look up an encode_response result in the shared parquet cache
+    """
+    cache_file = ENCODE_CACHE_DIR / f"{cache_key}.parquet"
+    if not cache_file.exists():
+        return None
+    pyarrow = import_pyarrow()
+    if pyarrow is None:
+        return None
+    pa, pq = pyarrow
+    # As with the local cache, a bad entry is a miss rather than a failed run
+    try:
+        table = pq.read_table(cache_file, columns=["key", "payload"])
+        # Each entry stores its own key so a copied or renamed file can't
+        # be served for the wrong inputs
+        if table.num_rows != 1 or table.column("key")[0].as_py() != cache_key:
+            return None
+        scored_result = SurveyResponse.model_validate_json(
+            table.column("payload")[0].as_py()
+        )
+    except (OSError, ValueError, pa.ArrowException) as e:
+        logger.warning(f"Ignoring unreadable shared cache entry {cache_file}: {e}")
+        return None
+    logger.info(f"Using shared cached scoring result {cache_key}")
+    return scored_result
+
+
+def write_encode_cache(cache_key: str, scored_json: str):
+    """
+    Add an encode_response result to the shared parquet cache
+    """
+    pyarrow = import_pyarrow()
+    if pyarrow is None:
+        return
+    pa, pq = pyarrow
+    cache_file = ENCODE_CACHE_DIR / f"{cache_key}.parquet"
+    row = pa.table({"key": [cache_key], "payload": [scored_json.encode("utf-8")]})
+    # Write beside the entry and swap it in so readers never see a partial
+    # file; the suffix is unique per writer so concurrent stores don't collide
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        ENCODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        pq.write_table(row, tmp_file)
+        os.replace(tmp_file, cache_file)
+    except (OSError, pa.ArrowException) as e:
+        logger.warning(f"Could not store shared cache entry {cache_file}: {e}")
+        tmp_file.unlink(missing_ok=True)
+
+
+def save_scoring_json(scored_json: str, scoring_file: Path):
+    scoring_file.write_text(scored_json, encoding="utf-8")
+    logger.info(f"Scoring results saved to: {scoring_file}")
+
+
+def save_csv_report(scored_result: SurveyResponse, module, report_path: Path):
+    generate_csv_report(scored_result, module, report_path)
+    logger.info(f"csv report saved to: {report_path}")
+
+
+def save_html_report(scored_dict: dict, html_file: Path):
+    html_file.write_text(generate_html_report(scored_dict))
+    logger.info(f"HTML report saved to: {html_file}")
+
+
+def extract_responses(
+    conversation_id: ULID,
+    module_id: ULID,
+    upload: bool = True,
+    outputs: tuple[str, ...] = OUTPUT_FORMATS,
+):
     local_workspace: Path = (
         Path(os.getenv("LOCAL_WORKSPACE") or ".") / str(conversation_id) / "scoring"
     )
@@ -77,35 +245,79 @@ def extract_responses(conversation_id: ULID, module_id: ULID, upload: bool = Tru
     module_transcript = extract_transcript(full_transcript, module_id)
 
     # Load the survey
-    module = fetch_survey_module(module_id)
-    module_reorder = reorder_module_questions(module)
-    survey = load_survey_config(module_reorder)
-
-    # Score the survey
-    scored_result = encode_response(
-        survey.model_dump_json(indent=True), module_transcript
-    )
+    module_reorder, survey = load_module_survey(module_id)
+
+    # Score the survey, reusing an earlier result for identical inputs
+    survey_json = survey.model_dump_json(indent=2)
+    scored_result = None
+    local_hit = shared_hit = False
+    use_cache = scoring_cache_enabled()
+    if use_cache:
+        # Hash the transcript once; both cache keys are derived from the digest
+        transcript_sha = hashlib.sha256(module_transcript.encode()).hexdigest()
+        encode_key = encode_cache_key(survey_json, transcript_sha)
+        cache_file = (
+            local_workspace
+            / ".cache"
+            / f"{scoring_cache_key(module_id, survey_json, transcript_sha)}.json"
+        )
+        scored_result = load_cached_score(cache_file)
+        local_hit = scored_result is not None
+        if not local_hit:
+            scored_result = read_encode_cache(encode_key)
+            shared_hit = scored_result is not None
+
+    if scored_result is None:
+        scored_result = encode_response(survey_json, module_transcript)
+
+    # Serialize once; the caches and the JSON file share the same string
+    scored_json = scored_result.model_dump_json(indent=4)
+    if use_cache and not local_hit:
+        store_cached_score(cache_file, scored_json)
+        if not shared_hit:
+            write_encode_cache(encode_key, scored_json)
 
     if upload:
         upload_responses(conversation_id, module_id, scored_result)
 
-    # Save the scoring output
-    scoring_file = local_workspace / f"{module_id}_responses.json"
-    with open(scoring_file, "w") as f:
-        json.dump(scored_result.model_dump(), f, indent=4)
-    logger.info(f"Scoring results saved to: {scoring_file}")
-
-    # Save csv report
-    report_path = local_workspace / f"{module_id}_responses.csv"
-    generate_csv_report(scored_result, module_reorder, report_path)
-    logger.info(f"csv report saved to: {report_path}")
-
-    # Save html report
-    html = generate_html_report(scored_result.model_dump())
-    html_file = local_workspace / f"{module_id}_responses.html"
-    with open(html_file, "w") as f:
-        f.write(html)
-    logger.info(f"HTML report saved to: {html_file}")
+    # Only render the requested outputs
+    jobs = []
+    if "json" in outputs:
+        scoring_file = local_workspace / f"{module_id}_responses.json"
+        jobs.append((save_scoring_json, scored_json, scoring_file))
+    if "csv" in outputs:
+        report_path = local_workspace / f"{module_id}_responses.csv"
+        jobs.append((save_csv_report, scored_result, module_reorder, report_path))
+    if "html" in outputs:
+        html_file = local_workspace / f"{module_id}_responses.html"
+        # The HTML report wants python values (enums, datetimes, ...), not a JSON round trip
+        jobs.append((save_html_report, scored_result.model_dump(), html_file))
+
+    if not jobs:
+        return
+
+    # Write the outputs concurrently so disk I/O overlaps the HTML render;
+    # each job runs in a copy of this context to keep the module log prefix
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, *job) for job in jobs
+        ]
+        for future in futures:
+            future.result()
+
+
+def extract_module_responses(
+    conversation_id: ULID, conversation_module, upload: bool, outputs: tuple[str, ...]
+):
+    token = current_module_title.set(conversation_module.moduleTitle)
+    try:
+        logger.info(f"Extracting responses for module {conversation_module.moduleId}")
+        extract_responses(
+            conversation_id, parse_ulid(conversation_module.moduleId), upload, outputs
+        )
+        logger.info("Done")
+    finally:
+        current_module_title.reset(token)
 
 
 # def extract_responses_subject_judgment(conversation_id: ULID, module_id: ULID, upload: bool = True):
@@ -164,31 +376,71 @@ def extract_responses(conversation_id: ULID, module_id: ULID, upload: bool = Tru
 
 
 def cli():
+    # Configure logging here rather than at import so importing this module
+    # never touches the host's logging setup
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="{asctime} - {levelname} - {message}",
+            style="{",
+            datefmt="%Y-%m-%d %H:%M",
+        )
+
     parser = argparse.ArgumentParser()
     parser.add_argument("-c", "--conversation_id", action="store", required=True)
     parser.add_argument("-m", "--module_id", action="store")
     parser.add_argument("-v", "--verbose", action="store_true")
     parser.add_argument("-u", "--upload", action="store_true")
+    parser.add_argument(
+        "-o",
+        "--outputs",
+        action="store",
+        default=",".join(OUTPUT_FORMATS),
+        help="comma-separated report formats to write (json,csv,html)",
+    )
     args = parser.parse_args()
 
+    outputs = tuple(x.strip() for x in args.outputs.split(",") if x.strip())
+    unknown = set(outputs) - set(OUTPUT_FORMATS)
+    if unknown:
+        parser.error(f"unknown output format(s): {', '.join(sorted(unknown))}")
+
     if args.verbose:
-        logger.level = logging.DEBUG
+        logger.setLevel(logging.DEBUG)
 
+    conversation_id = parse_ulid(args.conversation_id)
     if args.module_id:
-        extract_responses(args.conversation_id, args.module_id, args.upload)
+        extract_responses(
+            conversation_id, parse_ulid(args.module_id), args.upload, outputs
+        )
     else:
         voz = VozApi()
         conversation = voz.get_conversation(args.conversation_id)
-        for cm in [
+        modules = [
             x
             for x in conversation.conversationModules
             if x.wasCompleted and "ARQ" not in x.moduleTitle
-        ]:
-            logger.info("-" * len(cm.moduleTitle))
-            logger.info(cm.moduleId)
-            logger.info(cm.moduleTitle)
-            logger.info("-" * len(cm.moduleTitle))
-            extract_responses(args.conversation_id, cm.moduleId, args.upload)
+        ]
+        failed = []
+        with ThreadPoolExecutor(max_workers=MODULE_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    extract_module_responses, conversation_id, cm, args.upload, outputs
+                ): cm.moduleTitle
+                for cm in modules
+            }
+            # Let every module finish and report each failure, not just the first
+            for future in as_completed(futures):
+                title = futures[future]
+                try:
+                    future.result()
+                except Exception:
+                    logger.exception(f"[{title}] Failed to extract responses")
+                    failed.append(title)
+        if failed:
+            raise SystemExit(
+                f"Failed to extract responses for {len(failed)} module(s): {', '.join(failed)}"
+            )
 
 
 if __name__ == "__main__":
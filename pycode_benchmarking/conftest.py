@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Import test modules the way run_benchmarking.py does (PYTHONPATH set to
+# this directory by pythonrunner.js), so numba's on-disk kernel cache is
+# keyed by the same module names in tests and in real runs
+sys.path.insert(0, str(Path(__file__).resolve().parent))
@@ -1,10 +1,17 @@
 import argparse
+import asyncio
+import inspect
 import json
 from datetime import datetime
 from pathlib import Path
 import traceback
 import sys
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 from tests import (
     conversation_flow,
     # engagement,
@@ -12,32 +19,74 @@ from tests import (
     # conversation_health,
 )
 
+TESTS = [
+    conversation_flow,
+    # engagement,
+    # response_quality,
+    # conversation_health,
+]
+
+
+async def run_test(test, transcript):
+    if inspect.iscoroutinefunction(test.run):
+        return await test.run(transcript)
+    # Synchronous tests are CPU-bound; keep them off the event loop
+    return await asyncio.to_thread(test.run, transcript)
+
+
+def failed_test(test, error):
+    traceback.print_exception(type(error), error, error.__traceback__, file=sys.stderr)
+    return {
+        "title": test.__name__.rsplit(".", 1)[-1],
+        "error": str(error),
+        "error_type": type(error).__name__,
+        "variables": [
+            {"metric": "Error", "value": str(error), "status": "poor"},
+        ],
+    }
+
+
+async def run_tests(transcript):
+    # One failing test is reported in place instead of failing the batch
+    results = await asyncio.gather(
+        *(run_test(test, transcript) for test in TESTS),
+        return_exceptions=True,
+    )
+    return [
+        failed_test(test, result) if isinstance(result, Exception) else result
+        for test, result in zip(TESTS, results)
+    ]
+
+
+def dump_json(payload) -> str:
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(payload, default=str, option=option).decode()
+    return json.dumps(payload, indent=2, default=str)
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--run-id", required=True)
     parser.add_argument("--transcript", required=True)
     parser.add_argument("--workspace", required=True)
+    # Still passed by pythonrunner.js; no test consumes it yet
     parser.add_argument("--options", required=True)
 
     args = parser.parse_args()
 
-    transcript = Path(args.transcript).read_text().strip()
-    options = args.options
+    # Strip before decoding so only one str copy of the transcript is made
+    transcript = Path(args.transcript).read_bytes().strip().decode("utf-8")
     try:
-        tests = [
-            conversation_flow.run(transcript, options),
-            # engagement.run(transcript),
-            # response_quality.run(transcript),
-            # conversation_health.run(transcript),
-        ]
+        tests = asyncio.run(run_tests(transcript))
 
         print("BENCHMARK_RESULT_START")
-        print(json.dumps({
+        print(dump_json({
             "success": True,
             "run_id": args.run_id,
             "timestamp": datetime.now().isoformat(),
             "tests": tests,
-        }, indent=2))
+        }))
         print("BENCHMARK_RESULT_END")
 
     except Exception as e:
@@ -45,11 +94,11 @@ def main():
         traceback.print_exc(file=sys.stderr)
 
         print("BENCHMARK_ERROR_START")
-        print(json.dumps({
+        print(dump_json({
             "success": False,
             "error": str(e),
             "error_type": type(e).__name__,
-        }, indent=2))
+        }))
         print("BENCHMARK_ERROR_END")
         raise SystemExit(1)
 
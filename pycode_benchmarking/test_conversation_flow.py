@@ -0,0 +1,58 @@
+import pytest
+
+from tests import conversation_flow
+
+TRANSCRIPTS = [
+    "",
+    "\n",
+    "AGENT: hi\nPARTICIPANT: hello\n",
+    "AGENT: hi\nPARTICIPANT: hello\nAGENT: bye",
+    "AGENT: a\rPARTICIPANT: b",
+    "x\x85AGENT: y",
+    "AGENT: a PARTICIPANT: b\nAGENT:",
+    "AGENT: a\r\nPARTICIPANT: b\r\n",
+    "PARTICIPANT\nAGEN\nx PARTICIPANT: y\nPARTICIPANT:",
+    "AGENT: a\u2028PARTICIPANT: b\nAGENT:",
+]
+
+
+def _vectorized_counters():
+    counters = []
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return counters
+    counters.append(conversation_flow._count_turns_numpy)
+    from tests._kernels import classify
+    if classify is not None:
+        counters.append(conversation_flow._count_turns_jit)
+    return counters
+
+
+@pytest.mark.parametrize("transcript", TRANSCRIPTS)
+@pytest.mark.parametrize("count", _vectorized_counters())
+def test_vectorized_paths_match_loop(count, transcript):
+    assert count(transcript) == conversation_flow._count_turns_loop(transcript)
+
+
+@pytest.mark.parametrize("transcript", TRANSCRIPTS)
+def test_bytes_input_matches_str(transcript):
+    assert conversation_flow.run(transcript.encode()) == conversation_flow.run(transcript)
+    assert conversation_flow._count_turns_loop(
+        transcript.encode()
+    ) == conversation_flow._count_turns_loop(transcript)
+
+
+@pytest.mark.parametrize("transcript, total, balance", [
+    ("", 0, None),
+    ("PARTICIPANT: x", 1, "inf"),
+    ("AGENT: a\nPARTICIPANT: b\nPARTICIPANT: c", 3, 2.0),
+    ("AGENT: a\nnote\nPARTICIPANT: b\n", 3, 1.0),
+    ("AGENT: a\rPARTICIPANT: b\nAGENT: c", 2, 0.0),
+])
+def test_run_reports_turns_and_balance(transcript, total, balance):
+    variables = conversation_flow.run(transcript)["variables"]
+    assert variables == [
+        {"metric": "Total Turns", "value": total},
+        {"metric": "Turn Balance", "value": balance},
+    ]
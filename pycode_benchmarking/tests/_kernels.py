@@ -0,0 +1,47 @@
+"""Numba-compiled scanning kernels shared by the benchmarking tests.
+
+numba is optional: when it is not installed ``classify`` is ``None`` and
+callers fall back to their numpy / pure Python paths.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+NEWLINE = 0x0A
+
+
+def _starts_with(buf, start, end, prefix):
+    if end - start < prefix.size:
+        return False
+    for i in range(prefix.size):
+        if buf[start + i] != prefix[i]:
+            return False
+    return True
+
+
+def _classify(buf, agent, participant):
+    total = agent_n = participant_n = 0
+    line_start = 0
+    n = buf.size
+    for i in range(n + 1):
+        if i < n and buf[i] != NEWLINE:
+            continue
+        if i == n and line_start == n:
+            # Empty input or trailing newline: no further line to count
+            break
+        total += 1
+        if _starts_with(buf, line_start, i, agent):
+            agent_n += 1
+        elif _starts_with(buf, line_start, i, participant):
+            participant_n += 1
+        line_start = i + 1
+    return total, agent_n, participant_n
+
+
+if njit is not None:
+    _starts_with = njit(cache=True)(_starts_with)
+    classify = njit(cache=True)(_classify)
+else:
+    classify = None
@@ -1,15 +1,120 @@
-def run(transcript: str) -> dict:
-    lines = transcript.split("\n")
-    agent = [l for l in lines if l.startswith("AGENT:")]
-    participant = [l for l in lines if l.startswith("PARTICIPANT:")]
+import io
+import sys
 
-    total = len(lines)
-    balance = len(participant) / len(agent) if agent else 0
+AGENT_PREFIX = "AGENT:"
+PARTICIPANT_PREFIX = "PARTICIPANT:"
+AGENT_PREFIX_BYTES = AGENT_PREFIX.encode()
+PARTICIPANT_PREFIX_BYTES = PARTICIPANT_PREFIX.encode()
+
+# Measured with numpy already imported: at 16K chars numpy and the loop tie,
+# from 64K on numpy is ~2x faster. Import costs are not included; see
+# _count_turns_large.
+VECTORIZE_MIN_CHARS = 64 * 1024
+
+
+def _as_bytes(transcript: str | bytes) -> bytes:
+    return transcript if isinstance(transcript, bytes) else transcript.encode()
+
+
+def _count_turns_loop(transcript: str | bytes) -> tuple[int, int, int]:
+    # Lines end at "\n" only, as in the numpy and numba paths; splitlines()
+    # would also break on "\r", "\x85", "\u2028", ... inside a turn's content
+    if isinstance(transcript, bytes):
+        agent, participant = AGENT_PREFIX_BYTES, PARTICIPANT_PREFIX_BYTES
+        lines = io.BytesIO(transcript)
+    else:
+        agent, participant = AGENT_PREFIX, PARTICIPANT_PREFIX
+        lines = io.StringIO(transcript, newline="\n")
+
+    agent_n = participant_n = total = 0
+    for line in lines:
+        total += 1
+        if line.startswith(agent):
+            agent_n += 1
+        elif line.startswith(participant):
+            participant_n += 1
+    return total, agent_n, participant_n
+
+
+def _count_turns_numpy(transcript: str | bytes) -> tuple[int, int, int]:
+    import numpy as np
+
+    buf = np.frombuffer(_as_bytes(transcript), dtype=np.uint8)
+    if not buf.size:
+        return 0, 0, 0
+
+    starts = np.concatenate(([0], np.flatnonzero(buf == 0x0A) + 1))
+    if starts[-1] == buf.size:
+        # A trailing newline does not open another line
+        starts = starts[:-1]
+
+    agent = np.frombuffer(AGENT_PREFIX_BYTES, dtype=np.uint8)
+    participant = np.frombuffer(PARTICIPANT_PREFIX_BYTES, dtype=np.uint8)
+    width = max(agent.size, participant.size)
+
+    # Zero padding can never match a prefix byte, so short final lines are safe
+    padded = np.concatenate((buf, np.zeros(width, dtype=np.uint8)))
+    heads = padded[starts[:, None] + np.arange(width)]
+
+    agent_n = int((heads[:, :agent.size] == agent).all(axis=1).sum())
+    participant_n = int((heads[:, :participant.size] == participant).all(axis=1).sum())
+    return int(starts.size), agent_n, participant_n
+
+
+def _count_turns_jit(transcript: str | bytes) -> tuple[int, int, int]:
+    import numpy as np
+
+    from ._kernels import classify
+
+    total, agent_n, participant_n = classify(
+        np.frombuffer(_as_bytes(transcript), dtype=np.uint8),
+        np.frombuffer(AGENT_PREFIX_BYTES, dtype=np.uint8),
+        np.frombuffer(PARTICIPANT_PREFIX_BYTES, dtype=np.uint8),
+    )
+    return int(total), int(agent_n), int(participant_n)
+
+
+def _loaded_kernel():
+    # The numba kernel, if something in this process has already compiled or
+    # loaded it; a dispatcher has no signatures until its first call
+    kernels = sys.modules.get(f"{__package__}._kernels")
+    classify = getattr(kernels, "classify", None)
+    return classify if classify is not None and classify.signatures else None
+
+
+def _count_turns_large(transcript: str | bytes) -> tuple[int, int, int]:
+    # The runner starts a fresh interpreter per benchmark run. There, importing
+    # numba and loading the cached kernel costs 0.5-1s and importing numpy
+    # 0.1-0.25s, against ~6ms/MB saved over the loop; in a cold process numpy
+    # did not win even at 256MB. So only already-loaded machinery is used and
+    # nothing is imported here.
+    if _loaded_kernel() is not None:
+        return _count_turns_jit(transcript)
+    if "numpy" in sys.modules:
+        return _count_turns_numpy(transcript)
+    return _count_turns_loop(transcript)
+
+
+def run(transcript: str | bytes) -> dict:
+    # Raw UTF-8 bytes are accepted as well and skip the re-encode on the fast paths
+    if len(transcript) < VECTORIZE_MIN_CHARS:
+        total, agent_n, participant_n = _count_turns_loop(transcript)
+    else:
+        total, agent_n, participant_n = _count_turns_large(transcript)
+
+    if agent_n:
+        balance = round(participant_n / agent_n, 2)
+    elif participant_n:
+        # Participant-only transcript: the ratio is unbounded. JSON has no
+        # infinity literal, so it is reported as a string.
+        balance = "inf"
+    else:
+        balance = None
 
     return {
         "title": "Conversation Flow Test",
         "variables": [
             {"metric": "Total Turns", "value": total},
-            {"metric": "Turn Balance", "value": round(balance, 2)},
+            {"metric": "Turn Balance", "value": balance},
         ],
     }
@@ -0,0 +1,335 @@
+"""
+Score benchmark transcripts with vCDR.
+
+Single run, printing the result between VCDR_RESULT_START / VCDR_RESULT_END:
+
+    python scripts/score_one.py --conversation-id <run_id> \
+        --interviewer-prompt "Subject - Orientation" \
+        --transcript data/metrics/<run_id>/transcript.txt
+
+Worker mode (--worker) imports vCDR once and then serves newline-delimited
+JSON requests from stdin, one JSON line per response on stdout:
+
+    {"id": 1, "conversation_id": "...", "interviewer_prompt": "...",
+     "transcript_path": "...", "workspace": "..."}
+
+Everything else printed while scoring goes to stderr in worker mode so
+stdout only carries responses.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import traceback
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+DEFAULT_VCDR_DIR = Path(__file__).resolve().parent.parent / "external" / "vCDR"
+GIT_META_CACHE = Path.home() / ".cache" / "vcdr_meta.json"
+
+MODULE_ID_MAP = MappingProxyType({
+    'Subject - Memory - Part 1': '01KEWNHMWCMHQZMW901TZY3V2W',
+    'Subject - Memory - Part 2': '01KEWNHMX47Z4D9FQ4HD15BAV4',
+    'Subject - Orientation': '01KEWNHMX47R4ZANXZB72XQZDX',
+    'Subject - Judgement & Problem Solving': '01KEWNHMX44EKVHD18NXMZZ16V',
+    'Partner - Memory - Part 1': '01KEWNHMX4SH8HEN1E4YTATQF2',
+    'Partner - Memory - Part 2': '01KEWNHMX417VK0YR2YEVX9B75',
+    'Partner - Orientation': '01KEWNHMX5R7Y0Z86K4XBNR1YW',
+    'Partner - Judgement & Problem Solving': '01KEWNHMX5BJK9H4XRD9KNF29W',
+    'Partner - Community Affairs': '01KEWNHMX56WKPKG1CDPESEQVQ',
+    'Partner - Home & Hobbies': '01KEWNHMX5JD91W5R3DSWEH8X4',
+    'Partner - Personal Care': '01KEWNHMX5A9EEHF9TTXBP98V3',
+})
+
+
+def moduleTitle2ID(title: str) -> str:
+    # Prompt names usually equal a module title exactly
+    module_id = MODULE_ID_MAP.get(title)
+    if module_id is not None:
+        return module_id
+
+    # Otherwise the title must contain exactly one module title
+    found = 0
+    for key, value in MODULE_ID_MAP.items():
+        if key in title:
+            found += 1
+            module_id = value
+            if found > 1:
+                break
+
+    if found != 1:
+        raise ValueError(
+            f"Expected exactly one match for title '{title}', found {found}"
+        )
+
+    return module_id
+
+
+@lru_cache(maxsize=32)
+def parse_ulid(value: str):
+    from ulid import ULID
+
+    return ULID.from_str(value)
+
+
+def _git_dir(repo_path: Path) -> Path:
+    git_path = repo_path / ".git"
+    if git_path.is_file():
+        # Submodule checkouts hold a "gitdir: <path>" pointer instead of a directory
+        git_path = (repo_path / git_path.read_text().split(":", 1)[1].strip()).resolve()
+    return git_path
+
+
+def _head_fingerprint(git_dir: Path) -> list:
+    # HEAD only changes on checkout; new commits touch the branch ref instead
+    head = git_dir / "HEAD"
+    stamps = [str(git_dir), head.stat().st_mtime_ns]
+    head_text = head.read_text().strip()
+    if head_text.startswith("ref:"):
+        ref = git_dir / head_text[4:].strip()
+        target = ref if ref.exists() else git_dir / "packed-refs"
+        if target.exists():
+            stamps.append(target.stat().st_mtime_ns)
+    return stamps
+
+
+def get_git_info(repo_path: Path) -> dict:
+    # The fingerprint is part of the in-process cache key so a long-lived
+    # worker still notices when the vCDR checkout moves
+    fingerprint = _head_fingerprint(_git_dir(repo_path))
+    return _read_git_info(repo_path, tuple(fingerprint))
+
+
+@lru_cache(maxsize=8)
+def _read_git_info(repo_path: Path, fingerprint: tuple) -> dict:
+    try:
+        cached = json.loads(GIT_META_CACHE.read_text())
+        if cached.get("fingerprint") == list(fingerprint):
+            return cached["info"]
+    except (OSError, ValueError):
+        pass
+
+    # One fork for both values: --abbrev-ref applies to the second HEAD only
+    git_commit, git_branch = subprocess.check_output(
+        ['git', 'rev-parse', 'HEAD', '--abbrev-ref', 'HEAD'],
+        cwd=repo_path,
+        stderr=subprocess.DEVNULL,
+    ).decode().split()
+    info = {
+        "git_commit": git_commit,
+        "git_branch": git_branch,
+        "git_commit_short": git_commit[:8],
+    }
+
+    try:
+        GIT_META_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        GIT_META_CACHE.write_text(json.dumps({"fingerprint": list(fingerprint), "info": info}))
+    except OSError:
+        pass
+    return info
+
+
+def collect_metadata(vcdr_src: Path) -> dict:
+    import voz_vcdr
+
+    metadata = {
+        "analysis_timestamp": datetime.now().isoformat(),
+        "python_version": sys.version,
+        "vcdr_source_path": str(vcdr_src),
+    }
+
+    # Get Git information from vCDR repository
+    try:
+        metadata.update(get_git_info(vcdr_src.parent))
+    except Exception as e:
+        metadata.update({
+            "git_commit": "unknown",
+            "git_branch": "unknown",
+            "git_error": str(e)
+        })
+
+    metadata["vcdr_version"] = getattr(voz_vcdr, "__version__", "development")
+    return metadata
+
+
+def dump_json(value, indent=None) -> str:
+    # indent is either None or 2, the only indent orjson supports
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, default=str, option=option).decode()
+    return json.dumps(value, indent=indent, default=str)
+
+
+def dump_vcdr_result(result, indent=None) -> str:
+    # pydantic-core writes JSON directly, without building an intermediate dict
+    if hasattr(result, 'model_dump_json'):
+        return result.model_dump_json(indent=indent)
+    if hasattr(result, 'dict'):
+        result = result.dict()
+    return dump_json(result, indent=indent)
+
+
+def render_result(envelope: dict, vcdr_json: str, indent=None) -> str:
+    # orjson embeds the pre-serialized vCDR results as-is; Fragment needs
+    # orjson >= 3.9, so older versions and the stdlib encoder re-parse them
+    if orjson is not None and hasattr(orjson, "Fragment"):
+        vcdr_results = orjson.Fragment(vcdr_json)
+    else:
+        vcdr_results = json.loads(vcdr_json)
+    return dump_json({**envelope, "vcdr_results": vcdr_results}, indent=indent)
+
+
+def score(conversation_id: str, interviewer_prompt: str, transcript_path: str, vcdr_src: Path):
+    """
+    Score one transcript; returns the result envelope and the vCDR result
+    object, which is serialized separately by dump_vcdr_result
+    """
+    from voz_vcdr.extract_responses import extract_responses_benchmark
+
+    # Strip before decoding so only one str copy of the transcript is made
+    transcript_text = Path(transcript_path).read_bytes().strip().decode("utf-8")
+    metadata = collect_metadata(vcdr_src)
+
+    print(f"[PYTHON] Processing transcript for interviewer prompt: {interviewer_prompt}")
+    print(f"[PYTHON] Conversation ID: {conversation_id}")
+    print(f"[PYTHON] vCDR Metadata: {metadata}")
+
+    module_id = parse_ulid(moduleTitle2ID(interviewer_prompt))
+    result = extract_responses_benchmark(conversation_id, transcript_text, module_id)
+
+    envelope = {
+        "success": True,
+        "metadata": metadata,
+        "run_id": conversation_id
+    }
+    return envelope, result
+
+
+def error_result(conversation_id, error: Exception) -> dict:
+    return {
+        "success": False,
+        "error": str(error),
+        "error_type": type(error).__name__,
+        "run_id": conversation_id
+    }
+
+
+def run_once(args, vcdr_src: Path):
+    try:
+        envelope, result = score(args.conversation_id, args.interviewer_prompt, args.transcript, vcdr_src)
+        # The results are embedded verbatim, so keep them compact rather
+        # than indented relative to the top level
+        payload = render_result(envelope, dump_vcdr_result(result), indent=2)
+    except Exception as e:
+        traceback.print_exc(file=sys.stderr)
+        print("VCDR_ERROR_START")
+        print(dump_json(error_result(args.conversation_id, e), indent=2))
+        print("VCDR_ERROR_END")
+        sys.exit(1)
+
+    print("VCDR_RESULT_START")
+    print(payload)
+    print("VCDR_RESULT_END")
+
+
+@contextlib.contextmanager
+def in_workspace(workspace):
+    """
+    Run one request inside its workspace, restoring the cwd and
+    LOCAL_WORKSPACE afterwards so nothing leaks into the next request
+    """
+    if not workspace:
+        yield
+        return
+
+    cwd = os.getcwd()
+    previous = os.environ.get("LOCAL_WORKSPACE")
+    os.environ["LOCAL_WORKSPACE"] = workspace
+    os.chdir(workspace)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+        if previous is None:
+            os.environ.pop("LOCAL_WORKSPACE", None)
+        else:
+            os.environ["LOCAL_WORKSPACE"] = previous
+
+
+def serve(vcdr_src: Path):
+    responses = sys.stdout
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        request = {}
+        with contextlib.redirect_stdout(sys.stderr):
+            try:
+                request = json.loads(line)
+                with in_workspace(request.get("workspace")):
+                    envelope, result = score(
+                        request["conversation_id"],
+                        request["interviewer_prompt"],
+                        request["transcript_path"],
+                        vcdr_src,
+                    )
+                # Compact JSON keeps each response on a single line
+                envelope["id"] = request.get("id")
+                payload = render_result(envelope, dump_vcdr_result(result))
+            except Exception as e:
+                traceback.print_exc()
+                response = error_result(request.get("conversation_id"), e)
+                response["id"] = request.get("id")
+                payload = dump_json(response)
+
+        responses.write(payload + "\n")
+        responses.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vcdr-dir", default=str(DEFAULT_VCDR_DIR))
+    parser.add_argument("--worker", action="store_true")
+    parser.add_argument("--conversation-id")
+    parser.add_argument("--interviewer-prompt")
+    parser.add_argument("--transcript")
+    args = parser.parse_args()
+
+    # Results carry raw UTF-8; a Windows pipe would otherwise use the ANSI code page
+    sys.stdout.reconfigure(encoding="utf-8")
+    sys.stderr.reconfigure(encoding="utf-8", errors="backslashreplace")
+
+    if not args.worker and not (args.conversation_id and args.interviewer_prompt and args.transcript):
+        parser.error("--conversation-id, --interviewer-prompt and --transcript are required without --worker")
+
+    vcdr_src = Path(args.vcdr_dir) / "src"
+    sys.path.insert(0, str(vcdr_src))
+
+    # Import vCDR up front so a worker pays for it once
+    try:
+        import voz_vcdr.extract_responses  # noqa: F401
+        import ulid  # noqa: F401
+    except ImportError as e:
+        print(f"IMPORT_ERROR: Could not import vCDR modules: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.worker:
+        serve(vcdr_src)
+    else:
+        run_once(args, vcdr_src)
+
+
+if __name__ == "__main__":
+    main()
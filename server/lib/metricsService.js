@@ -165,243 +165,198 @@ async function generateSimplifiedMetrics(conversationHistory) {
   };
 }
 
+const vCDRDir = path.join(__dirname, '..', '..', 'external', 'vCDR');
+const scoreScriptPath = path.join(__dirname, '..', '..', 'scripts', 'score_one.py');
+const VCDR_TIMEOUT_MS = 60000;
+
+// Long-lived Python process that imports vCDR once and scores requests sent over stdin
+let scoringWorker = null;
+
 /**
- * Call the vCDR Python scoring system
- * @param {string} transcriptPath - Path to transcript file
- * @param {string} runId - The run identifier
- * @param {string} workspaceDir - Working directory for this run
- * @param {string} interviewerPrompt - Name of the interviewer prompt
- * @returns {Promise<Object>} vCDR scoring results
+ * Get the running vCDR scoring worker, starting it on first use
+ * @returns {Object} Worker state: process, queued and active requests, next request id
  */
-async function callVCDRScoring(transcriptPath, runId, workspaceDir, interviewerPrompt) {
-  return new Promise((resolve, reject) => {
-    const vCDRDir = path.join(__dirname, '..', '..', 'external', 'vCDR');
-
-    // Create a custom Python script to process our data
-    const customScriptPath = path.join(workspaceDir, 'run_scoring.py');
-    const customScript = `
-import sys
-import os
-import json
-from pathlib import Path
-from datetime import datetime
-
-# Add vCDR to Python path
-# Use raw string to handle Windows backslashes properly
-vcdr_src = Path(r"${vCDRDir}") / "src"
-sys.path.insert(0, str(vcdr_src))
-
-try:
-    from voz_vcdr.extract_responses import extract_responses_benchmark
-    from voz_vcdr.models import SurveyResponse
-    from ulid import ULID
-    def moduleTitle2ID(title: str) -> str:
-        mapping = {
-            'Subject - Memory - Part 1': '01KEWNHMWCMHQZMW901TZY3V2W',
-            'Subject - Memory - Part 2': '01KEWNHMX47Z4D9FQ4HD15BAV4',
-            'Subject - Orientation': '01KEWNHMX47R4ZANXZB72XQZDX',
-            'Subject - Judgement & Problem Solving': '01KEWNHMX44EKVHD18NXMZZ16V',
-            'Partner - Memory - Part 1': '01KEWNHMX4SH8HEN1E4YTATQF2',
-            'Partner - Memory - Part 2': '01KEWNHMX417VK0YR2YEVX9B75',
-            'Partner - Orientation': '01KEWNHMX5R7Y0Z86K4XBNR1YW',
-            'Partner - Judgement & Problem Solving': '01KEWNHMX5BJK9H4XRD9KNF29W',
-            'Partner - Community Affairs': '01KEWNHMX56WKPKG1CDPESEQVQ',
-            'Partner - Home & Hobbies': '01KEWNHMX5JD91W5R3DSWEH8X4',
-            'Partner - Personal Care': '01KEWNHMX5A9EEHF9TTXBP98V3',
-        }
+function getScoringWorker() {
+  if (scoringWorker) {
+    return scoringWorker;
+  }
 
-        matches = [v for k, v in mapping.items() if k in title]
+  // Use the vCDR virtual environment's Python executable
+  const vCDRVenvPython = process.platform === 'win32'
+    ? path.join(vCDRDir, '.venv', 'Scripts', 'python.exe')
+    : path.join(vCDRDir, '.venv', 'bin', 'python');
 
-        if len(matches) != 1:
-            raise ValueError(
-                f"Expected exactly one match for title '{title}', found {len(matches)}"
-            )
+  console.log(`[METRICS] Using vCDR virtual environment Python: ${vCDRVenvPython}`);
 
-        return matches[0]
-    # Read the transcript
-    # Use raw string to handle Windows backslashes properly
-    with open(r"${transcriptPath}", "r") as f:
-        transcript_text = f.read().strip()
+  // Check if vCDR virtual environment exists
+  if (!fs.existsSync(vCDRVenvPython)) {
+    throw new Error(`vCDR virtual environment not found at ${vCDRVenvPython}. Please run 'uv sync' in the vCDR directory: ${vCDRDir}`);
+  }
 
-    # Collect vCDR metadata
-    import subprocess
-    import voz_vcdr
+  console.log(`[METRICS] Starting vCDR scoring worker: ${scoreScriptPath}`);
 
-    metadata = {
-        "analysis_timestamp": datetime.now().isoformat(),
-        "python_version": sys.version,
-        "vcdr_source_path": str(vcdr_src),
+  const pythonProcess = spawn(vCDRVenvPython, [scoreScriptPath, '--worker', '--vcdr-dir', vCDRDir], {
+    env: {
+      ...process.env,
+      PYTHONPATH: path.join(vCDRDir, 'src')
     }
+  });
 
-    # Get Git information from vCDR repository
-    try:
-        vcdr_repo_path = vcdr_src.parent
-        git_commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'],
-                                           cwd=vcdr_repo_path,
-                                           stderr=subprocess.DEVNULL).decode().strip()
-        git_branch = subprocess.check_output(['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-                                           cwd=vcdr_repo_path,
-                                           stderr=subprocess.DEVNULL).decode().strip()
-        metadata.update({
-            "git_commit": git_commit,
-            "git_branch": git_branch,
-            "git_commit_short": git_commit[:8]
-        })
-    except Exception as e:
-        metadata.update({
-            "git_commit": "unknown",
-            "git_branch": "unknown",
-            "git_error": str(e)
-        })
-
-    # Get vCDR version if available
-    try:
-        if hasattr(voz_vcdr, '__version__'):
-            metadata["vcdr_version"] = voz_vcdr.__version__
-        else:
-            metadata["vcdr_version"] = "development"
-    except:
-        metadata["vcdr_version"] = "unknown"
-
-    # Use the interviewer prompt for module ID mapping
-    interviewer_prompt = "${interviewerPrompt}"
-    conversation_id = "${runId}"
-
-    print(f"[PYTHON] Processing transcript for interviewer prompt: {interviewer_prompt}")
-    print(f"[PYTHON] Conversation ID: {conversation_id}")
-    print(f"[PYTHON] vCDR Metadata: {metadata}")
-
-    # Call the vCDR scoring function
-    try:
-        module_id_string = moduleTitle2ID(interviewer_prompt)
-        module_id = ULID.from_str(module_id_string)
-        result = extract_responses_benchmark(conversation_id, transcript_text, module_id)
-
-        # Convert result to dict if it's a Pydantic model
-        if hasattr(result, 'model_dump'):
-            vcdr_data = result.model_dump()
-        elif hasattr(result, 'dict'):
-            vcdr_data = result.dict()
-        else:
-            vcdr_data = result
-
-        # Structure the complete result with metadata and vCDR data
-        complete_result = {
-            "success": True,
-            "metadata": metadata,
-            "vcdr_results": vcdr_data,
-            "run_id": conversation_id
-        }
-
-        print("VCDR_RESULT_START")
-        print(json.dumps(complete_result, indent=2, default=str))
-        print("VCDR_RESULT_END")
+  // The worker scores one request at a time, so requests wait in a FIFO queue
+  // and only the active one has been written to stdin
+  const worker = { process: pythonProcess, queue: [], active: null, nextId: 1 };
+  let stdoutBuffer = '';
+  let stderrTail = '';
 
-    except Exception as e:
-        error_output = {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "run_id": "${runId}"
-        }
-        print("VCDR_ERROR_START")
-        print(json.dumps(error_output, indent=2))
-        print("VCDR_ERROR_END")
-        sys.exit(1)
-
-except ImportError as e:
-    print(f"IMPORT_ERROR: Could not import vCDR modules: {e}")
-    sys.exit(2)
-except Exception as e:
-    print(f"GENERAL_ERROR: {e}")
-    sys.exit(3)
-`;
-
-    // Write the custom script
-    fs.writeFileSync(customScriptPath, customScript);
-
-    console.log(`[METRICS] Calling Python script: ${customScriptPath}`);
-
-    // Use the vCDR virtual environment's Python executable
-    const vCDRVenvPython = process.platform === 'win32'
-      ? path.join(vCDRDir, '.venv', 'Scripts', 'python.exe')
-      : path.join(vCDRDir, '.venv', 'bin', 'python');
-
-    console.log(`[METRICS] Using vCDR virtual environment Python: ${vCDRVenvPython}`);
-
-    // Check if vCDR virtual environment exists
-    if (!fs.existsSync(vCDRVenvPython)) {
-      reject(new Error(`vCDR virtual environment not found at ${vCDRVenvPython}. Please run 'uv sync' in the vCDR directory: ${vCDRDir}`));
-      return;
+  const failPending = (error) => {
+    if (scoringWorker === worker) {
+      scoringWorker = null;
     }
+    const requests = worker.active ? [worker.active, ...worker.queue] : worker.queue;
+    worker.active = null;
+    worker.queue = [];
+    for (const request of requests) {
+      request.fail(error);
+    }
+  };
 
-    // Execute the custom Python script with vCDR's virtual environment
-    const pythonProcess = spawn(vCDRVenvPython, [customScriptPath], {
-      cwd: workspaceDir,
-      env: {
-        ...process.env,
-        PYTHONPATH: path.join(vCDRDir, 'src'),
-        LOCAL_WORKSPACE: workspaceDir
+  // Each response is one JSON line tagged with the id of its request. Decode
+  // as a stream so a multi-byte character split across chunks stays intact
+  pythonProcess.stdout.setEncoding('utf8');
+  pythonProcess.stdout.on('data', (data) => {
+    stdoutBuffer += data;
+    let newline;
+    while ((newline = stdoutBuffer.indexOf('\n')) !== -1) {
+      const line = stdoutBuffer.slice(0, newline).trim();
+      stdoutBuffer = stdoutBuffer.slice(newline + 1);
+      if (!line) {
+        continue;
       }
-    });
 
-    let stdout = '';
-    let stderr = '';
+      let message;
+      try {
+        message = JSON.parse(line);
+      } catch {
+        console.log(`[PYTHON STDOUT] ${line}`);
+        continue;
+      }
 
-    pythonProcess.stdout.on('data', (data) => {
-      const output = data.toString();
-      console.log(`[PYTHON STDOUT] ${output}`);
-      stdout += output;
-    });
+      const request = worker.active;
+      if (request && request.id === message.id) {
+        worker.active = null;
+        request.settle(message);
+        dispatchScoringRequest(worker);
+      }
+    }
+  });
 
-    pythonProcess.stderr.on('data', (data) => {
-      const output = data.toString();
-      console.log(`[PYTHON STDERR] ${output}`);
-      stderr += output;
-    });
+  pythonProcess.stderr.on('data', (data) => {
+    const output = data.toString();
+    console.log(`[PYTHON STDERR] ${output}`);
+    stderrTail = (stderrTail + output).slice(-4000);
+  });
 
-    pythonProcess.on('close', (code) => {
-      console.log(`[PYTHON] Process exited with code: ${code}`);
+  // Writing to a worker that already exited raises EPIPE here, not at write()
+  pythonProcess.stdin.on('error', (error) => {
+    failPending(new Error(`Failed to send request to vCDR Python process: ${error.message}`));
+    pythonProcess.kill();
+  });
 
-      if (code !== 0) {
-        reject(new Error(`vCDR Python script failed with code ${code}. STDERR: ${stderr}`));
-        return;
-      }
+  pythonProcess.on('close', (code) => {
+    console.log(`[PYTHON] Scoring worker exited with code: ${code}`);
+    failPending(new Error(`vCDR Python script failed with code ${code}. STDERR: ${stderrTail}`));
+  });
 
-      try {
-        // Parse the result from stdout
-        const resultMatch = stdout.match(/VCDR_RESULT_START\s*(.*?)\s*VCDR_RESULT_END/s);
-        const errorMatch = stdout.match(/VCDR_ERROR_START\s*(.*?)\s*VCDR_ERROR_END/s);
+  pythonProcess.on('error', (error) => {
+    failPending(new Error(`Failed to start vCDR Python process: ${error.message}`));
+  });
 
-        if (errorMatch) {
-          const errorData = JSON.parse(errorMatch[1]);
-          reject(new Error(`vCDR scoring error: ${errorData.error}`));
-          return;
-        }
+  scoringWorker = worker;
+  return worker;
+}
 
-        if (resultMatch) {
-          const resultData = JSON.parse(resultMatch[1]);
-          console.log(`[METRICS] Successfully parsed vCDR results`);
-          resolve(resultData);
-          return;
-        }
+/**
+ * Queue a scoring request on the current worker, starting one if needed
+ * @param {Object} request - Request message with settle/fail callbacks
+ */
+function enqueueScoringRequest(request) {
+  let worker;
+  try {
+    worker = getScoringWorker();
+  } catch (error) {
+    request.fail(error);
+    return;
+  }
 
-        // Fallback - if no structured output, return what we have
-        reject(new Error(`Could not parse vCDR results from output: ${stdout}`));
+  worker.queue.push(request);
+  dispatchScoringRequest(worker);
+}
 
-      } catch (parseError) {
-        reject(new Error(`Failed to parse vCDR output: ${parseError.message}. Raw output: ${stdout}`));
-      }
-    });
+/**
+ * Write the next queued request to the worker once it is idle; the timeout
+ * starts here so time spent waiting behind other requests is not counted
+ * @param {Object} worker - Worker state from getScoringWorker
+ */
+function dispatchScoringRequest(worker) {
+  if (worker.active || worker.queue.length === 0) {
+    return;
+  }
+
+  const request = worker.queue.shift();
+  request.id = worker.nextId++;
+  worker.active = request;
 
-    pythonProcess.on('error', (error) => {
-      reject(new Error(`Failed to start vCDR Python process: ${error.message}`));
-    });
+  // A hung request blocks the worker: replace it and move the queue to the new one
+  request.timer = setTimeout(() => {
+    if (scoringWorker === worker) {
+      scoringWorker = null;
+    }
+    const queued = worker.queue;
+    worker.active = null;
+    worker.queue = [];
+    worker.process.kill();
+    request.fail(new Error(`vCDR Python script timed out after ${VCDR_TIMEOUT_MS / 1000} seconds`));
+    for (const waiting of queued) {
+      enqueueScoringRequest(waiting);
+    }
+  }, VCDR_TIMEOUT_MS);
+
+  console.log(`[METRICS] Sending scoring request ${request.id} for run: ${request.message.conversation_id}`);
+  worker.process.stdin.write(JSON.stringify({ id: request.id, ...request.message }) + '\n');
+}
+
+/**
+ * Call the vCDR Python scoring system
+ * @param {string} transcriptPath - Path to transcript file
+ * @param {string} runId - The run identifier
+ * @param {string} workspaceDir - Working directory for this run
+ * @param {string} interviewerPrompt - Name of the interviewer prompt
+ * @returns {Promise<Object>} vCDR scoring results
+ */
+async function callVCDRScoring(transcriptPath, runId, workspaceDir, interviewerPrompt) {
+  return new Promise((resolve, reject) => {
+    const request = {
+      message: {
+        conversation_id: runId,
+        interviewer_prompt: interviewerPrompt,
+        transcript_path: transcriptPath,
+        workspace: workspaceDir
+      },
+      settle: ({ id: _id, ...resultData }) => {
+        clearTimeout(request.timer);
+        if (!resultData.success) {
+          reject(new Error(`vCDR scoring error: ${resultData.error}`));
+          return;
+        }
+        console.log(`[METRICS] Successfully parsed vCDR results`);
+        resolve(resultData);
+      },
+      fail: (error) => {
+        clearTimeout(request.timer);
+        reject(error);
+      }
+    };
 
-    // Set a timeout
-    setTimeout(() => {
-      pythonProcess.kill();
-      reject(new Error('vCDR Python script timed out after 60 seconds'));
-    }, 60000);
+    enqueueScoringRequest(request);
   });
 }
\ No newline at end of file